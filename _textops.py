@@ -0,0 +1,44 @@
+"""
+Text post-processing for Whisper translations
+
+Kept free of third-party imports and fully annotated so it can be
+compiled ahead of time with mypyc (`mypyc _textops.py`); the compiled
+extension is then imported in place of this file.
+"""
+
+import itertools
+from typing import Final, List
+
+_SHORT_TEXT_LEN: Final = 200  # Below this the plain loop is as fast
+
+def deduplicate_text(text: str) -> str:
+    """
+    Remove duplicate consecutive sentences or phrases.
+    Simple deduplication by removing consecutive duplicate sentences.
+    """
+    if not text or len(text) < _SHORT_TEXT_LEN:
+        return _deduplicate_short(text)
+    
+    # Strip/filter/collapse in C iterators: one strip per sentence, no Python loop
+    sentences: List[str] = list(filter(None, map(str.strip, text.split('.'))))
+    if not sentences:
+        return text
+    
+    deduplicated: List[str] = [sentence for sentence, _ in itertools.groupby(sentences)]
+    return '. '.join(deduplicated) + ('.' if text.rstrip().endswith('.') else '')
+
+def _deduplicate_short(text: str) -> str:
+    """Loop version of deduplicate_text for short inputs"""
+    if not text:
+        return text
+    
+    sentences: List[str] = [s.strip() for s in text.split('.') if s.strip()]
+    if not sentences:
+        return text
+    
+    deduplicated: List[str] = [sentences[0]]
+    for sentence in sentences[1:]:
+        if sentence != deduplicated[-1]:
+            deduplicated.append(sentence)
+    
+    return '. '.join(deduplicated) + ('.' if text.rstrip().endswith('.') else '')
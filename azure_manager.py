@@ -3,12 +3,28 @@ import json
 import traceback
 import sys
 import argparse
+import io
 import time
-from pathlib import Path
-from typing import Dict, Optional, List
+import threading
+import queue
+import asyncio
+import itertools
+import multiprocessing
+import smtplib
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, List, Set, Tuple
 from datetime import datetime
+import requests
 from azure.storage.blob import BlobServiceClient
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class Config:
     """Environment-based configuration"""
@@ -19,6 +35,28 @@ class Config:
     FAILED_CONTAINER = os.environ.get('FAILED_RECORDINGS_CONTAINER', 'failedrecordings')
     BATCH_SIZE = int(os.environ.get('BATCH_SIZE', '10'))
     
+    # Server-side filtering of the recordings listing
+    RECORDINGS_PREFIX = os.environ.get('RECORDINGS_PREFIX') or None
+    RECORDINGS_TAG_FILTER = os.environ.get('RECORDINGS_TAG_FILTER', '')  # e.g. "kind='audio'"
+    LIST_PAGE_SIZE = 5000  # Service maximum per LIST request
+    COPY_TIMEOUT_SECONDS = int(os.environ.get('COPY_TIMEOUT_SECONDS', '600'))  # Pending server-side copy is aborted after this
+    
+    # Concurrency
+    MAX_CONCURRENCY = int(os.environ.get('MAX_CONCURRENCY', '8'))
+    TRANSFER_CONCURRENCY = int(os.environ.get('TRANSFER_CONCURRENCY', '8'))  # Chunks in flight per blob
+    PIPELINE_DEPTH = int(os.environ.get('PIPELINE_DEPTH', '2'))  # Files queued between pipeline stages
+    ASYNC_CONCURRENCY = int(os.environ.get('ASYNC_CONCURRENCY', '32'))  # In-flight requests with --async
+    WHISPER_WORKERS = int(os.environ.get('WHISPER_WORKERS', '1'))  # Whisper processes (>1 uses a process pool)
+    WHISPER_GPUS = int(os.environ.get('WHISPER_GPUS', '0'))  # Pin workers round-robin to this many GPUs (0 = no pinning)
+    
+    # Transcriptions are uploaded as compact JSON unless pretty output is requested (debugging)
+    PRETTY_JSON = os.environ.get('TRANSCRIPTION_PRETTY_JSON', '').lower() in ('1', 'true', 'yes')
+    # HTTP connections kept per host - must cover every thread that can be in flight
+    CONNECTION_POOL_SIZE = int(os.environ.get(
+        'AZURE_POOL_MAXSIZE',
+        str(max(64, MAX_CONCURRENCY * TRANSFER_CONCURRENCY))
+    ))
+    
     # Email configuration
     EMAIL_RECIPIENTS = [r.strip() for r in os.environ.get('EMAIL_RECIPIENTS', '').split(',') if r.strip()]
     SMTP_SERVER = os.environ.get('SMTP_SERVER', 'smtp.gmail.com')
@@ -38,6 +76,18 @@ class Config:
         if not cls.SMTP_USERNAME or not cls.SMTP_PASSWORD:
             print("WARNING: Email credentials not configured - notifications disabled")
     
+    @classmethod
+    def _build_transport(cls) -> RequestsTransport:
+        """HTTP transport with a connection pool large enough for worker threads"""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=cls.CONNECTION_POOL_SIZE,
+            pool_maxsize=cls.CONNECTION_POOL_SIZE
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return RequestsTransport(session=session, session_owner=False)
+    
     @classmethod
     def get_blob_client(cls) -> BlobServiceClient:
         """Create Azure Blob Storage client"""
@@ -49,9 +99,17 @@ class Config:
         print(f"Processed: {cls.PROCESSED_CONTAINER}")
         print(f"Failed: {cls.FAILED_CONTAINER}")
         print(f"Batch Size: {cls.BATCH_SIZE}")
+        if cls.RECORDINGS_TAG_FILTER:
+            print(f"Tag Filter: {cls.RECORDINGS_TAG_FILTER}")
+        elif cls.RECORDINGS_PREFIX:
+            print(f"Prefix: {cls.RECORDINGS_PREFIX}")
+        print(f"Connection Pool: {cls.CONNECTION_POOL_SIZE}")
         
         try:
-            client = BlobServiceClient.from_connection_string(cls.CONNECTION_STRING)
+            client = BlobServiceClient.from_connection_string(
+                cls.CONNECTION_STRING,
+                transport=cls._build_transport()
+            )
             account_info = client.get_account_information()
             print("✓ Connected successfully")
             print(f"Account: {account_info.get('account_kind', 'Unknown')}")
@@ -71,6 +129,32 @@ class EmailNotifier:
             Config.SMTP_USERNAME and 
             Config.SMTP_PASSWORD
         )
+        self._smtp = None
+    
+    def _is_alive(self) -> bool:
+        """Check the cached SMTP connection with a NOOP"""
+        try:
+            return self._smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _conn(self) -> smtplib.SMTP:
+        """Authenticated SMTP connection, reused across reports (STARTTLS + login once)"""
+        if self._smtp is None or not self._is_alive():
+            self.close()
+            self._smtp = smtplib.SMTP(Config.SMTP_SERVER, Config.SMTP_PORT)
+            self._smtp.starttls()
+            self._smtp.login(Config.SMTP_USERNAME, Config.SMTP_PASSWORD)
+        return self._smtp
+    
+    def close(self):
+        """Close the cached SMTP connection"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
     
     def send_report(self, stats: Dict, errors: List[str] = None):
         """Send processing report"""
@@ -84,10 +168,6 @@ class EmailNotifier:
             return True
         
         try:
-            import smtplib
-            from email.mime.text import MIMEText
-            from email.mime.multipart import MIMEMultipart
-            
             msg = MIMEMultipart('alternative')
             msg['Subject'] = f"Whisper Processing Report - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
             msg['From'] = Config.EMAIL_FROM
@@ -101,16 +181,14 @@ class EmailNotifier:
             msg.attach(MIMEText(html_body, 'html'))
             
             # Send
-            with smtplib.SMTP(Config.SMTP_SERVER, Config.SMTP_PORT) as server:
-                server.starttls()
-                server.login(Config.SMTP_USERNAME, Config.SMTP_PASSWORD)
-                server.send_message(msg)
+            self._conn().send_message(msg)
             
             print(f"✓ Email sent to {len(Config.EMAIL_RECIPIENTS)} recipient(s)")
             return True
         
         except Exception as e:
             print(f"✗ Email failed: {e}")
+            self.close()
             return False
     
     def _create_text_report(self, stats: Dict, errors: List[str] = None) -> str:
@@ -155,7 +233,7 @@ class EmailNotifier:
         
         status_color = "#28a745" if success_rate >= 90 else "#ffc107" if success_rate >= 70 else "#dc3545"
         
-        html = f"""
+        parts = [f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -217,27 +295,111 @@ class EmailNotifier:
             <div class="value">{success_rate:.1f}%</div>
             <div class="stat-label" style="color: rgba(255,255,255,0.9);">Error Rate: {error_rate:.1f}%</div>
         </div>
-"""
+"""]
         
         if errors:
-            html += f"""
+            parts.append("""
         <div class="errors">
             <h2>⚠️ Errors</h2>
             <ul class="error-list">
-"""
+""")
             for err in errors[:10]:
-                html += f"                <li>{err}</li>\n"
+                parts.append(f"                <li>{err}</li>\n")
             if len(errors) > 10:
-                html += f"                <li><em>... and {len(errors)-10} more</em></li>\n"
-            html += """            </ul>
+                parts.append(f"                <li><em>... and {len(errors)-10} more</em></li>\n")
+            parts.append("""            </ul>
         </div>
-"""
+""")
         
-        html += """    </div>
+        parts.append("""    </div>
 </body>
 </html>
-"""
-        return html
+""")
+        return "".join(parts)
+
+class WhisperUnavailableError(RuntimeError):
+    """Whisper itself failed (not the audio); files must stay pending"""
+
+# Per-process Whisper model for WhisperWorkerPool workers
+_worker_processor = None
+
+def _init_whisper_worker(counter, gpus: int):
+    """Process pool initializer: pin a GPU and load the model once per worker"""
+    global _worker_processor
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if gpus > 0:
+        os.environ['CUDA_VISIBLE_DEVICES'] = str(index % gpus)
+    
+    from whisper_processor import WhisperProcessor
+    _worker_processor = WhisperProcessor()
+    _worker_processor.pin_whisper_thread()  # Tasks run on this (the worker's main) thread
+
+def _whisper_in_worker(audio: bytes, filename: str) -> Dict:
+    """Run Whisper inside a pool worker"""
+    return _worker_processor.process_audio(io.BytesIO(audio), filename)
+
+class WhisperWorkerPool:
+    """
+    Whisper across several processes, one model per process
+    Same process_audio() interface as WhisperProcessor
+    """
+    
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._ctx = multiprocessing.get_context('spawn')  # CUDA cannot be used after fork
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        print(f"Whisper workers: {workers} (GPUs: {Config.WHISPER_GPUS or 'not pinned'})")
+    
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._ctx,
+            initializer=_init_whisper_worker,
+            initargs=(self._ctx.Value('i', 0), Config.WHISPER_GPUS)
+        )
+    
+    def _restart(self, broken: ProcessPoolExecutor):
+        """Replace a broken executor (once, however many threads saw it break)"""
+        with self._lock:
+            if self._executor is broken:
+                print("  ⚠ Whisper worker died; restarting worker pool")
+                broken.shutdown(wait=False)
+                self._executor = self._new_executor()
+    
+    def process_audio(self, audio, filename: str) -> Dict:
+        """
+        Blocks the calling thread until a worker returns the result
+        
+        A dead worker (e.g. CUDA OOM) breaks the whole executor; it is
+        restarted and the file retried once. If that fails too, raises
+        WhisperUnavailableError.
+        """
+        data = audio.getvalue()
+        executor = self._executor
+        try:
+            return executor.submit(_whisper_in_worker, data, filename).result()
+        except BrokenProcessPool:
+            self._restart(executor)
+        
+        try:
+            return self._executor.submit(_whisper_in_worker, data, filename).result()
+        except BrokenProcessPool as e:
+            raise WhisperUnavailableError(f"Whisper worker pool failed: {e}") from e
+    
+    def cleanup(self):
+        """Stop the worker processes"""
+        self._executor.shutdown(wait=True)
+
+def create_whisper_processor():
+    """In-process WhisperProcessor, or a process pool when WHISPER_WORKERS > 1"""
+    if Config.WHISPER_WORKERS > 1:
+        return WhisperWorkerPool(Config.WHISPER_WORKERS)
+    
+    from whisper_processor import WhisperProcessor
+    return WhisperProcessor()
 
 class AzureProcessor:
     """
@@ -245,18 +407,38 @@ class AzureProcessor:
     No database - uses blob existence to determine processing status
     """
     
-    AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.MP3', '.WAV', '.M4A', '.FLAC', '.OGG'}
+    AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.flac', '.ogg'})
+    DELETE_BATCH_LIMIT = 256  # Max sub-requests per Blob Batch call
     
-    def __init__(self):
+    def __init__(self, whisper_processor=None, email: Optional[EmailNotifier] = None):
+        """
+        Args:
+            whisper_processor: Loaded processor to reuse across runs (the
+                caller owns it); by default one is created and cleaned up
+                per run
+            email: Notifier to reuse across runs, keeping its SMTP
+                connection (the caller owns it); by default one is created
+                and closed after the session report
+        """
         Config.validate()
         self.blob_client = Config.get_blob_client()
-        self.email = EmailNotifier()
+        self.whisper_processor = whisper_processor
+        self._shared_email = email
         
-        # Temp directory for downloads
-        self.temp_dir = Path('./temp_audio')
-        self.temp_dir.mkdir(exist_ok=True)
+        # Container clients are reused for every blob operation
+        self._containers = {
+            name: self.blob_client.get_container_client(name)
+            for name in (
+                Config.RECORDINGS_CONTAINER,
+                Config.TRANSCRIPTIONS_CONTAINER,
+                Config.PROCESSED_CONTAINER,
+                Config.FAILED_CONTAINER,
+            )
+        }
+        self.email = email if email is not None else EmailNotifier()
         
         # Statistics
+        self._stats_lock = threading.Lock()
         self.stats = {
             'start_time': datetime.now().isoformat(),
             'processed': 0,
@@ -265,57 +447,86 @@ class AzureProcessor:
             'moved': 0,
             'moved_to_failed': 0,
             'deleted': 0,
+            'skipped': 0,  # Already transcribed when scanned
+            'whisper_error': None,  # Set when Whisper fails and the run is aborted
             'errors': []
         }
         
-        print(f"Temp Directory: {self.temp_dir}")
         print(f"Email: {'ENABLED' if self.email.enabled else 'DISABLED'}")
         if self.email.enabled:
             print(f"  → {', '.join(Config.EMAIL_RECIPIENTS)}")
         print()
     
-    def is_processed(self, audio_blob: str) -> bool:
+    @classmethod
+    def is_audio(cls, blob_name: str) -> bool:
+        """Check the extension (case-insensitive) with a single set lookup"""
+        return os.path.splitext(blob_name)[1].lower() in cls.AUDIO_EXTENSIONS
+    
+    @staticmethod
+    def transcription_name(audio_blob: str) -> str:
+        """Name of the transcription blob for an audio blob"""
+        return audio_blob.rsplit('.', 1)[0] + '_transcription.json'
+    
+    def list_transcriptions(self) -> Set[str]:
+        """Load all existing transcription names (one LIST request per 5000 blobs)"""
+        container = self._containers[Config.TRANSCRIPTIONS_CONTAINER]
+        return {blob.name for blob in container.list_blobs(results_per_page=Config.LIST_PAGE_SIZE)}
+    
+    def is_processed(self, audio_blob: str, existing: Set[str]) -> bool:
         """Check if transcription already exists"""
-        transcription_name = audio_blob.rsplit('.', 1)[0] + '_transcription.json'
+        return self.transcription_name(audio_blob) in existing
+    
+    @staticmethod
+    def _list_recordings(container):
+        """
+        List candidate recordings, filtered server-side when configured
+        (works for both sync and aio container clients)
         
-        try:
-            blob = self.blob_client.get_blob_client(
-                Config.TRANSCRIPTIONS_CONTAINER, 
-                transcription_name
+        Tag queries return blobs without a size; callers treat size as optional.
+        """
+        if Config.RECORDINGS_TAG_FILTER:
+            return container.find_blobs_by_tags(
+                Config.RECORDINGS_TAG_FILTER,
+                results_per_page=Config.LIST_PAGE_SIZE
             )
-            blob.get_blob_properties()
-            return True
-        except ResourceNotFoundError:
-            return False
-        except Exception as e:
-            print(f"  ⚠ Error checking transcription: {e}")
-            return False
+        return container.list_blobs(
+            name_starts_with=Config.RECORDINGS_PREFIX,
+            results_per_page=Config.LIST_PAGE_SIZE
+        )
     
     def find_pending_files(self) -> List[str]:
         """Find all unprocessed audio files"""
-        container = self.blob_client.get_container_client(Config.RECORDINGS_CONTAINER)
+        container = self._containers[Config.RECORDINGS_CONTAINER]
         pending = []
-        orphans = []  # Has transcription but not moved
+        orphans = {}  # Has transcription but not moved (name -> size)
         total = 0
         
         print("Scanning for pending files...")
         
         try:
-            for blob in container.list_blobs():
-                total += 1
+            # The transcriptions listing is independent - fetch it while paging recordings
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                existing_future = executor.submit(self.list_transcriptions)
                 
-                # Check if it's an audio file
-                if not any(blob.name.endswith(ext) for ext in self.AUDIO_EXTENSIONS):
-                    continue
+                audio_blobs = []
+                for page in self._list_recordings(container).by_page():
+                    for blob in page:
+                        total += 1
+                        
+                        # Check if it's an audio file
+                        if self.is_audio(blob.name):
+                            audio_blobs.append((blob.name, getattr(blob, 'size', None)))
+                    print(f"  Scanned {total} blobs...")
                 
-                # Check processing status
-                if self.is_processed(blob.name):
-                    orphans.append(blob.name)
+                existing = existing_future.result()
+            print(f"  Existing transcriptions: {len(existing)}")
+            
+            # Check processing status
+            for blob_name, size in audio_blobs:
+                if self.is_processed(blob_name, existing):
+                    orphans[blob_name] = size
                 else:
-                    pending.append(blob.name)
-                
-                if total % 100 == 0:
-                    print(f"  Scanned {total} blobs...")
+                    pending.append(blob_name)
         
         except Exception as e:
             print(f"Scan failed: {e}")
@@ -326,6 +537,7 @@ class AzureProcessor:
         print(f"  Pending: {len(pending)}")
         print(f"  Orphans: {len(orphans)}")
         print()
+        self.stats['skipped'] = len(orphans)
         
         # Clean up orphans
         if orphans:
@@ -333,21 +545,48 @@ class AzureProcessor:
         
         return pending
     
-    def _cleanup_orphans(self, orphans: List[str]):
+    def _server_copy(self, source, dest) -> Optional[int]:
+        """
+        Copy a blob inside the storage service (no bytes through this machine)
+        and wait for the copy to finish. A copy still pending after
+        COPY_TIMEOUT_SECONDS is aborted and raises TimeoutError.
+        
+        Returns:
+            Destination size if the copy had to be polled, None if the service
+            completed it synchronously (the destination is then identical)
+        """
+        copy = dest.start_copy_from_url(source.url)
+        if copy['copy_status'] == 'success':
+            return None
+        
+        deadline = time.monotonic() + Config.COPY_TIMEOUT_SECONDS
+        props = dest.get_blob_properties()
+        while props.copy.status == 'pending':
+            if time.monotonic() > deadline:
+                try:
+                    dest.abort_copy(copy['copy_id'])
+                except Exception as e:
+                    print(f"  ⚠ Abort copy failed: {e}")
+                raise TimeoutError(f"Copy still pending after {Config.COPY_TIMEOUT_SECONDS}s (aborted)")
+            time.sleep(1)
+            props = dest.get_blob_properties()
+        
+        if props.copy.status != 'success':
+            raise RuntimeError(f"Copy {props.copy.status}: {props.copy.status_description}")
+        return props.size
+    
+    def _cleanup_orphans(self, orphans: Dict[str, int]):
         """Move orphaned files (transcribed but not moved)"""
         print("Cleaning up orphaned files...")
-        for blob_name in orphans:
+        for blob_name, size in orphans.items():
             try:
-                # Download
-                source = self.blob_client.get_blob_client(Config.RECORDINGS_CONTAINER, blob_name)
-                data = source.download_blob().readall()
-                
-                # Upload to processed
-                dest = self.blob_client.get_blob_client(Config.PROCESSED_CONTAINER, blob_name)
-                dest.upload_blob(data, overwrite=True)
+                # Server-side copy to processed
+                source = self._containers[Config.RECORDINGS_CONTAINER].get_blob_client(blob_name)
+                dest = self._containers[Config.PROCESSED_CONTAINER].get_blob_client(blob_name)
+                dest_size = self._server_copy(source, dest)
                 
-                # Verify and delete
-                if source.get_blob_properties().size == dest.get_blob_properties().size:
+                # Verify (size from the listing) and delete
+                if dest_size is None or size is None or dest_size == size:
                     source.delete_blob()
                     print(f"  ✓ Moved: {blob_name}")
                 else:
@@ -357,64 +596,250 @@ class AzureProcessor:
                 print(f"  ✗ Failed: {blob_name} - {e}")
         print()
     
-    def process_file(self, blob_name: str, processor) -> Dict:
-        """Process single audio file"""
-        local_path = self.temp_dir / Path(blob_name).name
-        
-        result = {
+    def _new_result(self, blob_name: str) -> Dict:
+        """Per-file result record passed through the pipeline stages"""
+        return {
             'blob_name': blob_name,
             'success': False,
             'error': None,
-            'whisper_result': None
+            'whisper_result': None,
+            'audio': None,  # In-memory download, released after Whisper
+            'size': None,
+            'aborted': False  # Not processed because Whisper failed; stays pending
         }
+    
+    def _record_failure(self, result: Dict, error: Exception):
+        """Mark a file as failed at any pipeline stage"""
+        result['error'] = str(error)
+        print(f"  ✗ {result['blob_name']}: {error}")
+        with self._stats_lock:
+            self.stats['errors'].append(f"{result['blob_name']}: {error}")
+    
+    def _abort_whisper(self, result: Dict, error: Exception):
+        """Whisper is unusable: leave this file (and the rest of the run) pending"""
+        result['aborted'] = True
+        result['audio'] = None
+        with self._stats_lock:
+            if self.stats['whisper_error'] is None:
+                self.stats['whisper_error'] = str(error)
+                self.stats['errors'].append(f"Run aborted, Whisper unavailable: {error}")
+                print(f"  ✗ Whisper unavailable, aborting run: {error}")
+    
+    def _download_file(self, result: Dict):
+        """Stage 1: download recording into memory (no temp file round trip)"""
+        blob = self._containers[Config.RECORDINGS_CONTAINER].get_blob_client(result['blob_name'])
+        downloader = blob.download_blob(max_concurrency=Config.TRANSFER_CONCURRENCY)
+        audio = io.BytesIO()
+        downloader.readinto(audio)
+        audio.seek(0)
+        result['audio'] = audio
+        result['size'] = downloader.size
+        print(f"  ✓ Downloaded {result['blob_name']} ({downloader.size:,} bytes)")
+    
+    def _transcribe_file(self, result: Dict, processor):
+        """Stage 2: run Whisper on the in-memory audio and validate the translation"""
+        try:
+            whisper_result = processor.process_audio(result['audio'], os.path.basename(result['blob_name']))
+        finally:
+            result['audio'] = None
+        result['whisper_result'] = whisper_result
+        
+        if whisper_result.get('status') != 'success':
+            raise ValueError(whisper_result.get('error', 'Processing failed'))
+        
+        # Check if translation is empty or whitespace-only
+        translation = whisper_result.get('translation', '').strip()
+        if not translation:
+            raise ValueError("Translation is empty or contains only whitespace")
+        
+        print(f"  ✓ Processed ({whisper_result.get('word_count', 0)} words)")
+    
+    @staticmethod
+    def _pinned(pin, func, *args):
+        """Apply a processor CPU pinning to this pool thread, then call func (to_thread mixes decode and Whisper)"""
+        if pin is not None:
+            pin()
+        return func(*args)
+    
+    @staticmethod
+    def _transcription_payload(whisper_result: Dict) -> bytes:
+        """Serialized transcription JSON (UTF-8, orjson when installed)"""
+        if orjson is not None:
+            return orjson.dumps(whisper_result, option=orjson.OPT_INDENT_2 if Config.PRETTY_JSON else 0)
+        if Config.PRETTY_JSON:
+            return json.dumps(whisper_result, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(whisper_result, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    def _upload_transcription(self, result: Dict):
+        """Stage 3: upload the transcription JSON"""
+        trans_name = self.transcription_name(result['blob_name'])
+        trans_blob = self._containers[Config.TRANSCRIPTIONS_CONTAINER].get_blob_client(trans_name)
+        trans_blob.upload_blob(
+            self._transcription_payload(result['whisper_result']),
+            overwrite=True,
+            max_concurrency=Config.TRANSFER_CONCURRENCY
+        )
+        print(f"  ✓ Uploaded {trans_name}")
+    
+    def process_batch_files(self, batch_files: List[str], processor) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Process one batch as a three-stage pipeline:
+        download (+ audio decode) thread -> Whisper (this thread, plus one thread per extra
+        pool worker) -> upload thread
+        
+        Bounded queues between the stages overlap network I/O with Whisper
+        while capping how many downloaded files wait in memory.
+        
+        Returns:
+            (successful results, failed results)
+        """
+        workers = getattr(processor, 'workers', 1)
+        decode = getattr(processor, 'decode_audio', None)  # In-process Whisper only
+        pin_decode = getattr(processor, 'pin_decode_thread', None)
+        pin_whisper = getattr(processor, 'pin_whisper_thread', None)
+        ready_q = queue.Queue(maxsize=Config.PIPELINE_DEPTH)
+        upload_q = queue.Queue(maxsize=Config.PIPELINE_DEPTH)
+        counter = itertools.count(1)
+        successful = []
+        failed = []
+        
+        def downloader():
+            if pin_decode is not None:
+                pin_decode()
+            try:
+                for blob_name in batch_files:
+                    if self.stats['whisper_error'] is not None:
+                        break
+                    result = self._new_result(blob_name)
+                    try:
+                        self._download_file(result)
+                        if decode is not None:
+                            result['audio'] = decode(result['audio'])
+                    except Exception as e:
+                        self._record_failure(result, e)
+                    ready_q.put(result)
+            finally:
+                for _ in range(workers):
+                    ready_q.put(None)
+        
+        def transcriber():
+            if pin_whisper is not None:
+                pin_whisper()
+            while True:
+                result = ready_q.get()
+                if result is None:
+                    break
+                
+                if self.stats['whisper_error'] is not None:
+                    result['aborted'] = True  # Drain: left pending for the next run
+                    result['audio'] = None
+                    continue
+                
+                print(f"[{next(counter)}/{len(batch_files)}] {result['blob_name']}")
+                if result['error'] is None:
+                    try:
+                        self._transcribe_file(result, processor)
+                    except WhisperUnavailableError as e:
+                        self._abort_whisper(result, e)
+                        continue
+                    except Exception as e:
+                        self._record_failure(result, e)
+                upload_q.put(result)
+        
+        def uploader():
+            while True:
+                result = upload_q.get()
+                if result is None:
+                    break
+                
+                if result['error'] is None:
+                    try:
+                        self._upload_transcription(result)
+                        result['success'] = True
+                    except Exception as e:
+                        self._record_failure(result, e)
+                
+                with self._stats_lock:
+                    self.stats['processed'] += 1
+                    if result['success']:
+                        self.stats['successful'] += 1
+                        successful.append(result)
+                    else:
+                        self.stats['failed'] += 1
+                        failed.append(result)
+                
+                print(f"  {'✓ SUCCESS' if result['success'] else '✗ FAILED'}: {result['blob_name']}\n")
+        
+        download_thread = threading.Thread(target=downloader, name='downloader', daemon=True)
+        upload_thread = threading.Thread(target=uploader, name='uploader', daemon=True)
+        # Own threads (not this one) so CPU pinning stays with the pipeline
+        transcribers = [
+            threading.Thread(target=transcriber, name=f'whisper-{i}', daemon=True)
+            for i in range(workers)
+        ]
+        download_thread.start()
+        upload_thread.start()
+        for thread in transcribers:
+            thread.start()
         
         try:
-            # Download
-            print("  [1/3] Downloading...")
-            blob = self.blob_client.get_blob_client(Config.RECORDINGS_CONTAINER, blob_name)
-            with open(local_path, 'wb') as f:
-                f.write(blob.download_blob().readall())
-            size = local_path.stat().st_size
-            print(f"  ✓ Downloaded ({size:,} bytes)")
-            
-            # Process with Whisper
-            print("  [2/3] Processing...")
-            whisper_result = processor.process_audio_file(str(local_path))
-            result['whisper_result'] = whisper_result
-            
-            if whisper_result.get('status') != 'success':
-                raise ValueError(whisper_result.get('error', 'Processing failed'))
-            
-            # Check if translation is empty or whitespace-only
-            translation = whisper_result.get('translation', '').strip()
-            if not translation:
-                raise ValueError("Translation is empty or contains only whitespace")
-            
-            print(f"  ✓ Processed ({whisper_result.get('word_count', 0)} words)")
-            
-            # Upload transcription
-            print("  [3/3] Uploading transcription...")
-            trans_name = blob_name.rsplit('.', 1)[0] + '_transcription.json'
-            trans_blob = self.blob_client.get_blob_client(
-                Config.TRANSCRIPTIONS_CONTAINER,
-                trans_name
-            )
-            trans_blob.upload_blob(
-                json.dumps(whisper_result, indent=2, ensure_ascii=False).encode('utf-8'),
-                overwrite=True
-            )
-            print(f"  ✓ Uploaded")
-            
-            result['success'] = True
-            result['local_path'] = str(local_path)
+            for thread in transcribers:
+                thread.join()
+        finally:
+            upload_q.put(None)
+            upload_thread.join()
+        download_thread.join()
         
+        return successful, failed
+    
+    def _move_one(self, file_info: Dict) -> Tuple[bool, bool, Optional[str]]:
+        """
+        Copy one successful recording to processed and verify the copy
+        
+        Returns:
+            (moved, ready to delete original, error message)
+        """
+        blob_name = file_info['blob_name']
+        source = self._containers[Config.RECORDINGS_CONTAINER].get_blob_client(blob_name)
+        dest = self._containers[Config.PROCESSED_CONTAINER].get_blob_client(blob_name)
+        
+        try:
+            dest_size = self._server_copy(source, dest)
         except Exception as e:
-            result['error'] = str(e)
-            result['local_path'] = str(local_path)
-            print(f"  ✗ Failed: {e}")
-            self.stats['errors'].append(f"{blob_name}: {e}")
+            return False, False, f"Move failed: {blob_name} ({e})"
         
-        return result
+        # Verify against the size captured at download time
+        if dest_size is not None and file_info['size'] is not None and dest_size != file_info['size']:
+            return True, False, f"Size mismatch: {blob_name}"
+        return True, True, None
+    
+    def _delete_recordings(self, blob_names: List[str]) -> List[str]:
+        """
+        Delete recordings using the Blob Batch API (up to 256 deletes per request)
+        
+        Returns:
+            Names that could not be deleted
+        """
+        container = self._containers[Config.RECORDINGS_CONTAINER]
+        failed = []
+        
+        for i in range(0, len(blob_names), self.DELETE_BATCH_LIMIT):
+            chunk = blob_names[i:i + self.DELETE_BATCH_LIMIT]
+            try:
+                responses = container.delete_blobs(*chunk, raise_on_any_failure=False)
+                for blob_name, response in zip(chunk, responses):
+                    if response.status_code not in (200, 202):
+                        failed.append(blob_name)
+            except Exception as e:
+                # Batch endpoint unavailable (e.g. hierarchical namespace) - delete one by one
+                print(f"  ⚠ Batch delete failed ({e}), deleting individually")
+                for blob_name in chunk:
+                    try:
+                        container.delete_blob(blob_name)
+                    except Exception:
+                        failed.append(blob_name)
+        
+        return failed
     
     def move_and_delete(self, successful_files: List[Dict]):
         """Batch move to processed and delete from recordings"""
@@ -426,56 +851,57 @@ class AzureProcessor:
         print("="*80)
         print(f"Files: {len(successful_files)}\n")
         
-        # Move to processed
-        print("[1/2] Moving to processed...")
-        moved = []
-        for file_info in successful_files:
-            blob_name = file_info['blob_name']
-            local_path = Path(file_info['local_path'])
-            
-            try:
-                dest = self.blob_client.get_blob_client(Config.PROCESSED_CONTAINER, blob_name)
-                with open(local_path, 'rb') as f:
-                    dest.upload_blob(f, overwrite=True)
-                moved.append(blob_name)
-                self.stats['moved'] += 1
-                print(f"  ✓ {blob_name}")
-            except Exception as e:
-                print(f"  ✗ {blob_name}: {e}")
-                self.stats['errors'].append(f"Move failed: {blob_name}")
-        
-        # Delete from recordings
-        print(f"\n[2/2] Deleting from recordings...")
-        for blob_name in moved:
-            try:
-                source = self.blob_client.get_blob_client(Config.RECORDINGS_CONTAINER, blob_name)
-                dest = self.blob_client.get_blob_client(Config.PROCESSED_CONTAINER, blob_name)
+        # Move to processed, one task per file
+        print(f"[1/2] Moving to processed ({Config.MAX_CONCURRENCY} workers)...")
+        verified = []
+        with ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENCY) as executor:
+            futures = {
+                executor.submit(self._move_one, file_info): file_info['blob_name']
+                for file_info in successful_files
+            }
+            for future in as_completed(futures):
+                blob_name = futures[future]
+                moved, deletable, error = future.result()
                 
-                # Verify sizes match
-                if source.get_blob_properties().size == dest.get_blob_properties().size:
-                    source.delete_blob()
-                    self.stats['deleted'] += 1
-                    print(f"  ✓ {blob_name}")
+                with self._stats_lock:
+                    if moved:
+                        self.stats['moved'] += 1
+                    if error:
+                        self.stats['errors'].append(error)
+                
+                if deletable:
+                    verified.append(blob_name)
+                
+                if error:
+                    print(f"  ✗ {blob_name}: {error}")
                 else:
-                    print(f"  ⚠ Size mismatch: {blob_name}")
-            except Exception as e:
-                print(f"  ✗ {blob_name}: {e}")
-                self.stats['errors'].append(f"Delete failed: {blob_name}")
+                    print(f"  ✓ {blob_name}")
         
-        # Cleanup temp files
-        for file_info in successful_files:
-            try:
-                Path(file_info['local_path']).unlink()
-            except:
-                pass
+        # Delete from recordings in batch requests
+        print(f"\n[2/2] Deleting {len(verified)} from recordings...")
+        if verified:
+            failed = self._delete_recordings(verified)
+            with self._stats_lock:
+                self.stats['deleted'] += len(verified) - len(failed)
+                self.stats['errors'].extend(f"Delete failed: {name}" for name in failed)
+            for blob_name in failed:
+                print(f"  ✗ {blob_name}")
+            print(f"  ✓ Deleted {len(verified) - len(failed)}")
         
         print("="*80 + "\n")
     
-    def move_to_failed(self, failed_files: List[Dict]):
-        """Batch move failed recordings to failed container"""
+    def move_to_failed(self, failed_files: List[Dict], timestamp: Optional[str] = None):
+        """
+        Batch move failed recordings to failed container
+        
+        Args:
+            timestamp: Batch timestamp written to every error record (default: now)
+        """
         if not failed_files:
             return
         
+        timestamp = timestamp or datetime.now().isoformat()
+        
         print("\n" + "="*80)
         print("BATCH MOVE TO FAILED")
         print("="*80)
@@ -483,30 +909,29 @@ class AzureProcessor:
         
         for file_info in failed_files:
             blob_name = file_info['blob_name']
-            local_path = Path(file_info['local_path'])
             
             try:
-                # Upload to failed container
-                dest = self.blob_client.get_blob_client(Config.FAILED_CONTAINER, blob_name)
-                with open(local_path, 'rb') as f:
-                    dest.upload_blob(f, overwrite=True)
+                # Server-side copy to failed container
+                source = self._containers[Config.RECORDINGS_CONTAINER].get_blob_client(blob_name)
+                dest = self._containers[Config.FAILED_CONTAINER].get_blob_client(blob_name)
+                self._server_copy(source, dest)
                 
                 # Upload error metadata
                 error_meta = {
                     'filename': blob_name,
                     'error': file_info.get('error'),
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                     'whisper_result': file_info.get('whisper_result')
                 }
                 meta_name = blob_name.rsplit('.', 1)[0] + '_error.json'
-                meta_blob = self.blob_client.get_blob_client(Config.FAILED_CONTAINER, meta_name)
+                meta_blob = self._containers[Config.FAILED_CONTAINER].get_blob_client(meta_name)
                 meta_blob.upload_blob(
                     json.dumps(error_meta, indent=2, ensure_ascii=False).encode('utf-8'),
-                    overwrite=True
+                    overwrite=True,
+                    max_concurrency=Config.TRANSFER_CONCURRENCY
                 )
                 
                 # Delete from recordings
-                source = self.blob_client.get_blob_client(Config.RECORDINGS_CONTAINER, blob_name)
                 source.delete_blob()
                 
                 self.stats['moved_to_failed'] += 1
@@ -515,12 +940,6 @@ class AzureProcessor:
             except Exception as e:
                 print(f"  ✗ {blob_name}: {e}")
                 self.stats['errors'].append(f"Move to failed failed: {blob_name}")
-            
-            # Cleanup temp file
-            try:
-                local_path.unlink()
-            except:
-                pass
         
         print("="*80 + "\n")
     
@@ -528,6 +947,7 @@ class AzureProcessor:
         """Process all pending files in batches"""
         batch_size = batch_size or Config.BATCH_SIZE
         start_time = time.time()
+        self.stats['start_time'] = datetime.fromtimestamp(start_time).isoformat()
         
         print("="*80)
         print("BATCH PROCESSING - ALL PENDING FILES")
@@ -553,10 +973,12 @@ class AzureProcessor:
         
         # Initialize Whisper
         try:
-            from whisper_processor import WhisperProcessor
-            processor = WhisperProcessor()
+            processor = self.whisper_processor or create_whisper_processor()
         except Exception as e:
             print(f"✗ Failed to initialize Whisper: {e}")
+            # Reported as a failed run, like a pool abort; files stay pending
+            self.stats['whisper_error'] = f"Initialization failed: {e}"
+            self.stats['errors'].append(f"Run aborted, Whisper failed to initialize: {e}")
             return self.stats
         
         # Process in batches
@@ -564,6 +986,7 @@ class AzureProcessor:
             start_idx = batch_num * batch_size
             end_idx = min(start_idx + batch_size, total_files)
             batch_files = pending[start_idx:end_idx]
+            batch_time = datetime.now().isoformat()
             
             print("="*80)
             print(f"BATCH {batch_num + 1}/{total_batches}")
@@ -571,23 +994,7 @@ class AzureProcessor:
             print(f"Files: {len(batch_files)} | Range: {start_idx+1}-{end_idx}/{total_files}")
             print("="*80 + "\n")
             
-            successful = []
-            failed = []
-            
-            for idx, blob_name in enumerate(batch_files, 1):
-                print(f"[{idx}/{len(batch_files)}] {blob_name}")
-                result = self.process_file(blob_name, processor)
-                
-                self.stats['processed'] += 1
-                
-                if result['success']:
-                    self.stats['successful'] += 1
-                    successful.append(result)
-                    print("  ✓ SUCCESS\n")
-                else:
-                    self.stats['failed'] += 1
-                    failed.append(result)
-                    print(f"  ✗ FAILED\n")
+            successful, failed = self.process_batch_files(batch_files, processor)
             
             # Move successful files to processed
             if successful:
@@ -595,9 +1002,19 @@ class AzureProcessor:
             
             # Move failed files to failed container
             if failed:
-                self.move_to_failed(failed)
+                self.move_to_failed(failed, timestamp=batch_time)
+            
+            if self.stats['whisper_error'] is not None:
+                print("✗ Whisper unavailable - remaining files left pending\n")
+                break
+        
+        if processor is not self.whisper_processor:
+            processor.cleanup()
         
-        # Final summary
+        return self._finish_session(start_time)
+    
+    def _finish_session(self, start_time: float) -> Dict:
+        """Print the final summary and send the email report"""
         duration = time.time() - start_time
         self.stats['duration_minutes'] = duration / 60
         
@@ -611,6 +1028,9 @@ class AzureProcessor:
         print(f"Moved to Processed: {self.stats['moved']}")
         print(f"Moved to Failed: {self.stats['moved_to_failed']}")
         print(f"Deleted: {self.stats['deleted']}")
+        print(f"Skipped (already transcribed): {self.stats['skipped']}")
+        if self.stats['whisper_error'] is not None:
+            print(f"ABORTED (Whisper unavailable, files left pending): {self.stats['whisper_error']}")
         
         if self.stats['processed'] > 0:
             success_rate = (self.stats['successful'] / self.stats['processed']) * 100
@@ -623,8 +1043,314 @@ class AzureProcessor:
         # Send email report only if recordings were processed
         if self.email.enabled:
             self.email.send_report(self.stats, self.stats['errors'])
+            if self.email is not self._shared_email:
+                self.email.close()
         
         return self.stats
+    
+    # ASYNC PATH (--async): same workflow on azure.storage.blob.aio, one event loop
+    
+    async def _server_copy_async(self, source, dest) -> Optional[int]:
+        """Async variant of _server_copy"""
+        copy = await dest.start_copy_from_url(source.url)
+        if copy['copy_status'] == 'success':
+            return None
+        
+        deadline = time.monotonic() + Config.COPY_TIMEOUT_SECONDS
+        props = await dest.get_blob_properties()
+        while props.copy.status == 'pending':
+            if time.monotonic() > deadline:
+                try:
+                    await dest.abort_copy(copy['copy_id'])
+                except Exception as e:
+                    print(f"  ⚠ Abort copy failed: {e}")
+                raise TimeoutError(f"Copy still pending after {Config.COPY_TIMEOUT_SECONDS}s (aborted)")
+            await asyncio.sleep(1)
+            props = await dest.get_blob_properties()
+        
+        if props.copy.status != 'success':
+            raise RuntimeError(f"Copy {props.copy.status}: {props.copy.status_description}")
+        return props.size
+    
+    async def _delete_recordings_async(self, client, blob_names: List[str]) -> List[str]:
+        """Async variant of _delete_recordings"""
+        container = client.get_container_client(Config.RECORDINGS_CONTAINER)
+        failed = []
+        
+        for i in range(0, len(blob_names), self.DELETE_BATCH_LIMIT):
+            chunk = blob_names[i:i + self.DELETE_BATCH_LIMIT]
+            try:
+                responses = await container.delete_blobs(*chunk, raise_on_any_failure=False)
+                statuses = [response.status_code async for response in responses]
+                failed.extend(name for name, status in zip(chunk, statuses) if status not in (200, 202))
+            except Exception as e:
+                print(f"  ⚠ Batch delete failed ({e}), deleting individually")
+                for blob_name in chunk:
+                    try:
+                        await container.delete_blob(blob_name)
+                    except Exception:
+                        failed.append(blob_name)
+        
+        return failed
+    
+    async def _move_one_async(self, client, file_info: Dict, sem: asyncio.Semaphore) -> Tuple[bool, bool, Optional[str]]:
+        """Async variant of _move_one"""
+        blob_name = file_info['blob_name']
+        source = client.get_blob_client(Config.RECORDINGS_CONTAINER, blob_name)
+        dest = client.get_blob_client(Config.PROCESSED_CONTAINER, blob_name)
+        
+        async with sem:
+            try:
+                dest_size = await self._server_copy_async(source, dest)
+            except Exception as e:
+                return False, False, f"Move failed: {blob_name} ({e})"
+        
+        # Verify against the size captured at download/list time
+        if dest_size is not None and file_info['size'] is not None and dest_size != file_info['size']:
+            return True, False, f"Size mismatch: {blob_name}"
+        return True, True, None
+    
+    async def find_pending_files_async(self, client) -> List[str]:
+        """Async variant of find_pending_files - both containers are listed concurrently"""
+        print("Scanning for pending files...")
+        
+        async def collect(pager) -> List:
+            return [blob async for blob in pager]
+        
+        try:
+            recordings, transcriptions = await asyncio.gather(
+                collect(self._list_recordings(client.get_container_client(Config.RECORDINGS_CONTAINER))),
+                collect(client.get_container_client(Config.TRANSCRIPTIONS_CONTAINER).list_blobs(
+                    results_per_page=Config.LIST_PAGE_SIZE
+                ))
+            )
+        except Exception as e:
+            print(f"Scan failed: {e}")
+            raise
+        
+        existing = {blob.name for blob in transcriptions}
+        pending = []
+        orphans = {}  # Has transcription but not moved (name -> size)
+        for blob in recordings:
+            if not self.is_audio(blob.name):
+                continue
+            if self.is_processed(blob.name, existing):
+                orphans[blob.name] = getattr(blob, 'size', None)
+            else:
+                pending.append(blob.name)
+        
+        print(f"Scan complete:")
+        print(f"  Total blobs: {len(recordings)}")
+        print(f"  Pending: {len(pending)}")
+        print(f"  Orphans: {len(orphans)}")
+        print()
+        self.stats['skipped'] = len(orphans)
+        
+        # Clean up orphans
+        if orphans:
+            print("Cleaning up orphaned files...")
+            sem = asyncio.Semaphore(Config.ASYNC_CONCURRENCY)
+            moves = await asyncio.gather(*(
+                self._move_one_async(client, {'blob_name': name, 'size': size}, sem)
+                for name, size in orphans.items()
+            ))
+            verified = [name for name, (_, deletable, _) in zip(orphans, moves) if deletable]
+            failed = await self._delete_recordings_async(client, verified) if verified else []
+            for name, (_, deletable, error) in zip(orphans, moves):
+                if error:
+                    print(f"  ✗ Failed: {name} - {error}")
+                elif deletable and name not in failed:
+                    print(f"  ✓ Moved: {name}")
+            print()
+        
+        return pending
+    
+    async def process_file_async(self, client, blob_name: str, processor,
+                                 sem: asyncio.Semaphore, ready_slots: asyncio.Semaphore,
+                                 whisper_slots: asyncio.Semaphore) -> Dict:
+        """
+        Download, transcribe and upload one file
+        
+        Network stages share the semaphore; decoding and Whisper run in
+        worker threads. ready_slots is taken before the download and bounds
+        the audio (downloaded or decoded) held in memory, like the sync
+        pipeline's queues; whisper_slots limits files in Whisper to one per
+        model.
+        """
+        decode = getattr(processor, 'decode_audio', None)  # In-process Whisper only
+        pin_decode = getattr(processor, 'pin_decode_thread', None)
+        pin_whisper = getattr(processor, 'pin_whisper_thread', None)
+        result = self._new_result(blob_name)
+        
+        try:
+            async with ready_slots:
+                if self.stats['whisper_error'] is not None:
+                    result['aborted'] = True  # Left pending for the next run
+                    return result
+                
+                async with sem:
+                    blob = client.get_blob_client(Config.RECORDINGS_CONTAINER, blob_name)
+                    downloader = await blob.download_blob(max_concurrency=Config.TRANSFER_CONCURRENCY)
+                    result['audio'] = io.BytesIO()
+                    await downloader.readinto(result['audio'])
+                    result['audio'].seek(0)
+                    result['size'] = downloader.size
+                print(f"  ✓ Downloaded {blob_name} ({downloader.size:,} bytes)")
+                
+                if decode is not None and self.stats['whisper_error'] is None:
+                    result['audio'] = await asyncio.to_thread(self._pinned, pin_decode, decode, result['audio'])
+                
+                async with whisper_slots:
+                    if self.stats['whisper_error'] is not None:
+                        result['aborted'] = True
+                        return result
+                    print(f"  Processing {blob_name}...")
+                    await asyncio.to_thread(
+                        self._pinned, pin_whisper, self._transcribe_file, result, processor
+                    )
+            
+            async with sem:
+                trans_name = self.transcription_name(blob_name)
+                trans_blob = client.get_blob_client(Config.TRANSCRIPTIONS_CONTAINER, trans_name)
+                await trans_blob.upload_blob(
+                    self._transcription_payload(result['whisper_result']),
+                    overwrite=True,
+                    max_concurrency=Config.TRANSFER_CONCURRENCY
+                )
+            print(f"  ✓ Uploaded {trans_name}")
+            result['success'] = True
+        
+        except WhisperUnavailableError as e:
+            self._abort_whisper(result, e)
+            return result
+        
+        except Exception as e:
+            self._record_failure(result, e)
+        
+        with self._stats_lock:
+            self.stats['processed'] += 1
+            self.stats['successful' if result['success'] else 'failed'] += 1
+        
+        return result
+    
+    async def move_and_delete_async(self, client, successful_files: List[Dict]):
+        """Async variant of move_and_delete"""
+        if not successful_files:
+            return
+        
+        print("\n" + "="*80)
+        print("BATCH MOVE & DELETE (SUCCESSFUL, ASYNC)")
+        print("="*80)
+        print(f"Files: {len(successful_files)}\n")
+        
+        sem = asyncio.Semaphore(Config.ASYNC_CONCURRENCY)
+        moves = await asyncio.gather(*(
+            self._move_one_async(client, file_info, sem) for file_info in successful_files
+        ))
+        
+        verified = []
+        for file_info, (moved, deletable, error) in zip(successful_files, moves):
+            blob_name = file_info['blob_name']
+            if moved:
+                self.stats['moved'] += 1
+            if deletable:
+                verified.append(blob_name)
+            if error:
+                self.stats['errors'].append(error)
+                print(f"  ✗ {blob_name}: {error}")
+            else:
+                print(f"  ✓ {blob_name}")
+        
+        if verified:
+            failed = await self._delete_recordings_async(client, verified)
+            self.stats['deleted'] += len(verified) - len(failed)
+            self.stats['errors'].extend(f"Delete failed: {name}" for name in failed)
+            print(f"  ✓ Deleted {len(verified) - len(failed)}")
+        
+        print("="*80 + "\n")
+    
+    async def process_all_async(self, batch_size: Optional[int] = None):
+        """Process all pending files in batches using the asyncio Azure SDK"""
+        from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+        
+        batch_size = batch_size or Config.BATCH_SIZE
+        start_time = time.time()
+        self.stats['start_time'] = datetime.fromtimestamp(start_time).isoformat()
+        
+        print("="*80)
+        print("BATCH PROCESSING - ALL PENDING FILES (ASYNC)")
+        print("="*80)
+        print(f"Batch size: {batch_size}")
+        print(f"Concurrency: {Config.ASYNC_CONCURRENCY}")
+        print("="*80 + "\n")
+        
+        async with AsyncBlobServiceClient.from_connection_string(Config.CONNECTION_STRING) as client:
+            pending = await self.find_pending_files_async(client)
+            
+            if not pending:
+                print("✓ No pending files\n")
+                return self.stats
+            
+            total_files = len(pending)
+            total_batches = (total_files + batch_size - 1) // batch_size
+            
+            print(f"PLAN:")
+            print(f"  Files: {total_files}")
+            print(f"  Batch size: {batch_size}")
+            print(f"  Batches: {total_batches}")
+            print()
+            
+            # Initialize Whisper
+            try:
+                processor = self.whisper_processor or create_whisper_processor()
+            except Exception as e:
+                print(f"✗ Failed to initialize Whisper: {e}")
+                # Reported as a failed run, like a pool abort; files stay pending
+                self.stats['whisper_error'] = f"Initialization failed: {e}"
+                self.stats['errors'].append(f"Run aborted, Whisper failed to initialize: {e}")
+                return self.stats
+            
+            sem = asyncio.Semaphore(Config.ASYNC_CONCURRENCY)
+            workers = getattr(processor, 'workers', 1)
+            ready_slots = asyncio.Semaphore(workers + Config.PIPELINE_DEPTH)
+            whisper_slots = asyncio.Semaphore(workers)
+            
+            for batch_num in range(total_batches):
+                start_idx = batch_num * batch_size
+                end_idx = min(start_idx + batch_size, total_files)
+                batch_files = pending[start_idx:end_idx]
+                batch_time = datetime.now().isoformat()
+                
+                print("="*80)
+                print(f"BATCH {batch_num + 1}/{total_batches}")
+                print("="*80)
+                print(f"Files: {len(batch_files)} | Range: {start_idx+1}-{end_idx}/{total_files}")
+                print("="*80 + "\n")
+                
+                results = await asyncio.gather(*(
+                    self.process_file_async(client, blob_name, processor, sem, ready_slots, whisper_slots)
+                    for blob_name in batch_files
+                ))
+                successful = [r for r in results if r['success']]
+                failed = [r for r in results if not r['success'] and not r['aborted']]
+                
+                # Move successful files to processed
+                if successful:
+                    await self.move_and_delete_async(client, successful)
+                
+                # Move failed files to failed container
+                if failed:
+                    await asyncio.to_thread(self.move_to_failed, failed, batch_time)
+                
+                if self.stats['whisper_error'] is not None:
+                    print("✗ Whisper unavailable - remaining files left pending\n")
+                    break
+            
+            if processor is not self.whisper_processor:
+                processor.cleanup()
+        
+        # Summary + SMTP report off the event loop
+        return await asyncio.to_thread(self._finish_session, start_time)
 
 def main():
     parser = argparse.ArgumentParser(description='Azure Whisper Processor')
@@ -632,13 +1358,18 @@ def main():
                        help='Command to run')
     parser.add_argument('--batch-size', type=int, 
                        help='Override batch size')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='Use the asyncio Azure SDK for blob I/O')
     args = parser.parse_args()
     
     try:
         processor = AzureProcessor()
         
         if args.command == 'process':
-            processor.process_all(batch_size=args.batch_size)
+            if args.use_async:
+                asyncio.run(processor.process_all_async(batch_size=args.batch_size))
+            else:
+                processor.process_all(batch_size=args.batch_size)
         
         elif args.command == 'test-email':
             print("Testing email...")
@@ -654,6 +1385,7 @@ def main():
             }
             test_errors = ['Test error 1', 'Test error 2']
             processor.email.send_report(test_stats, test_errors)
+            processor.email.close()
     
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
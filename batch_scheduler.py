@@ -1,16 +1,35 @@
 import os
 import sys
+import json
+import queue
+import atexit
+import asyncio
 import time
+import hmac
+import fcntl
 import signal
+import socket
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from azure_manager import AzureManager
+from azure_manager import AzureProcessor, EmailNotifier, create_whisper_processor
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
 
 # ============================================================================
 # CONFIGURATION
@@ -18,12 +37,25 @@ from azure_manager import AzureManager
 
 # Scheduler Configuration
 BATCH_INTERVAL_MINUTES = int(os.environ.get('BATCH_INTERVAL_MINUTES', '60'))  # Default: 1 hour
+MISFIRE_GRACE_SECONDS = 300  # Still run a job that starts up to 5 minutes late
 LOG_DIR = Path(os.environ.get('BATCH_LOG_DIR', './logs'))
 MAX_LOG_SIZE_MB = 100  # Max size per log file
 LOG_BACKUP_COUNT = 10  # Number of backup log files
 
 # Job State Tracking
 JOB_STATE_FILE = Path('./batch_job_state.json')
+JOB_LOCK_FILE = Path('./batch_job.lock')
+
+# Distributed lock (used instead of JOB_LOCK_FILE when REDIS_URL is set)
+REDIS_URL = os.environ.get('REDIS_URL')
+REDIS_LOCK_KEY = os.environ.get('BATCH_REDIS_LOCK_KEY', 'batch:lock')
+REDIS_LOCK_TTL_MARGIN_MS = 600000  # TTL = interval + 10 min; a dead holder auto-releases
+
+# Admin HTTP server (POST /trigger, GET /healthz); disabled unless a port is set
+ADMIN_HOST = os.environ.get('BATCH_ADMIN_HOST', '127.0.0.1')
+ADMIN_PORT = int(os.environ.get('BATCH_ADMIN_PORT', '0'))
+ADMIN_TOKEN = os.environ.get('BATCH_ADMIN_TOKEN')  # Required in the X-Admin-Token header
+ADMIN_TOKEN_HEADER = 'X-Admin-Token'
 
 # ============================================================================
 # LOGGING SETUP
@@ -38,6 +70,7 @@ def setup_logging() -> logging.Logger:
     - Console output for monitoring
     - Structured format with timestamps
     - Separate error log
+    - Handlers run on a background listener thread; logging calls only enqueue
     """
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -85,10 +118,18 @@ def setup_logging() -> logging.Logger:
         datefmt='%H:%M:%S'
     ))
     
-    # Add handlers
-    logger.addHandler(main_handler)
-    logger.addHandler(error_handler)
-    logger.addHandler(console_handler)
+    # Add handlers (formatting and writes happen on the listener thread)
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue,
+        main_handler,
+        error_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flushes queued records on exit
+    logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
@@ -103,94 +144,283 @@ class JobState:
     Track job execution state to prevent overlapping runs
     
     WHY: Prevent multiple batch jobs running simultaneously
-    HOW: Use a simple file-based lock mechanism
+    HOW: With REDIS_URL set, a Redis SET NX PX lock shared by all replicas
+         (renewed while the job runs; the TTL releases it if the holder
+         dies). Otherwise an exclusive
+         fcntl lock on JOB_LOCK_FILE (the kernel releases it if the process
+         dies). State lives in memory and is flushed to JOB_STATE_FILE for
+         the status command and restarts
     """
     
-    @staticmethod
-    def is_running() -> bool:
-        """Check if a job is currently running"""
-        if not JOB_STATE_FILE.exists():
+    _cache: Optional[dict] = None
+    _lock_fd: Optional[int] = None
+    _redis = None
+    _redis_token: Optional[str] = None
+    _renew_stop: Optional[threading.Event] = None
+    lock_ttl_ms: int = BATCH_INTERVAL_MINUTES * 60 * 1000 + REDIS_LOCK_TTL_MARGIN_MS
+    
+    # Delete the lock only if this process still holds it
+    _RELEASE_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+    
+    # Extend the lock TTL only if this process still holds it
+    _RENEW_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('pexpire', KEYS[1], ARGV[2])
+    end
+    return 0
+    """
+    
+    @classmethod
+    def set_interval(cls, interval_minutes: int):
+        """Size the Redis lock TTL from the scheduler interval"""
+        cls.lock_ttl_ms = interval_minutes * 60 * 1000 + REDIS_LOCK_TTL_MARGIN_MS
+    
+    @classmethod
+    def _renew_lock(cls, token: str, stop: threading.Event):
+        """Refresh the Redis lock TTL until the job completes"""
+        ttl = cls.lock_ttl_ms
+        while not stop.wait(ttl / 3000):
+            try:
+                if not cls._redis.eval(cls._RENEW_SCRIPT, 1, REDIS_LOCK_KEY, token, ttl):
+                    logger.error("Redis job lock lost while the job is running")
+                    return
+            except Exception as e:
+                logger.warning(f"Error renewing Redis lock: {e}")
+    
+    @classmethod
+    def _redis_client(cls):
+        """Redis client when REDIS_URL is configured, else None"""
+        if not REDIS_URL:
+            return None
+        if redis is None:
+            raise RuntimeError("REDIS_URL is set but the redis package is not installed")
+        if cls._redis is None:
+            cls._redis = redis.Redis.from_url(REDIS_URL)
+        return cls._redis
+    
+    @classmethod
+    def _save(cls, state: dict):
+        """Update in-memory state and flush it to disk"""
+        cls._cache = state
+        with open(JOB_STATE_FILE, 'w') as f:
+            json.dump(state, f, indent=2)
+    
+    @classmethod
+    def is_running(cls) -> bool:
+        """Check if a job is currently running (in this or another process)"""
+        if cls._lock_fd is not None or cls._redis_token is not None:
+            return True
+        
+        try:
+            client = cls._redis_client()
+            if client is not None:
+                return bool(client.exists(REDIS_LOCK_KEY))
+        except Exception as e:
+            logger.error(f"Error checking Redis lock: {e}")
             return False
         
         try:
-            import json
-            with open(JOB_STATE_FILE, 'r') as f:
-                state = json.load(f)
-            
-            # Check if job started more than 2 hours ago (stuck job)
-            start_time = datetime.fromisoformat(state.get('start_time', ''))
-            elapsed = (datetime.now() - start_time).total_seconds()
-            
-            if elapsed > 7200:  # 2 hours
-                logger.warning(f"Found stuck job from {start_time}, clearing state")
-                JobState.clear()
-                return False
-            
-            return state.get('running', False)
+            fd = os.open(JOB_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.error(f"Error opening job lock: {e}")
+            return False
         
-        except Exception as e:
-            logger.error(f"Error reading job state: {e}")
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
             return False
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)
     
-    @staticmethod
-    def mark_running():
-        """Mark job as running"""
-        import json
-        state = {
+    @classmethod
+    def mark_running(cls) -> bool:
+        """
+        Acquire the job lock and mark job as running
+        
+        Returns:
+            False if another job already holds the lock
+        """
+        if cls._lock_fd is not None or cls._redis_token is not None:
+            return False
+        
+        client = cls._redis_client()
+        if client is not None:
+            token = f"{socket.gethostname()}:{os.getpid()}:{time.time_ns()}"
+            if not client.set(REDIS_LOCK_KEY, token, nx=True, px=cls.lock_ttl_ms):
+                return False
+            cls._redis_token = token
+            cls._renew_stop = threading.Event()
+            threading.Thread(
+                target=cls._renew_lock, args=(token, cls._renew_stop),
+                name='redis-lock-renew', daemon=True
+            ).start()
+        else:
+            fd = os.open(JOB_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            cls._lock_fd = fd
+        
+        cls._save({
             'running': True,
             'start_time': datetime.now().isoformat(),
             'pid': os.getpid()
-        }
-        
-        with open(JOB_STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        })
+        return True
     
-    @staticmethod
-    def mark_complete(success: bool, stats: dict = None):
-        """Mark job as complete"""
-        import json
-        state = {
+    @classmethod
+    def mark_complete(cls, success: bool, stats: dict = None):
+        """Mark job as complete and release the lock"""
+        cls._save({
             'running': False,
             'last_run_time': datetime.now().isoformat(),
             'last_run_success': success,
             'last_run_stats': stats or {}
-        }
+        })
         
-        with open(JOB_STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        if cls._redis_token is not None:
+            cls._renew_stop.set()
+            cls._renew_stop = None
+            try:
+                cls._redis.eval(cls._RELEASE_SCRIPT, 1, REDIS_LOCK_KEY, cls._redis_token)
+            except Exception as e:
+                logger.error(f"Error releasing Redis lock (expires with TTL): {e}")
+            cls._redis_token = None
+        
+        if cls._lock_fd is not None:
+            fcntl.flock(cls._lock_fd, fcntl.LOCK_UN)
+            os.close(cls._lock_fd)
+            cls._lock_fd = None
     
-    @staticmethod
-    def clear():
+    @classmethod
+    def clear(cls):
         """Clear job state"""
+        cls._cache = None
         if JOB_STATE_FILE.exists():
             JOB_STATE_FILE.unlink()
     
-    @staticmethod
-    def get_last_run() -> Optional[dict]:
+    @classmethod
+    def get_last_run(cls) -> Optional[dict]:
         """Get information about last run"""
+        if cls._cache is not None:
+            return cls._cache
+        
         if not JOB_STATE_FILE.exists():
             return None
         
         try:
-            import json
             with open(JOB_STATE_FILE, 'r') as f:
-                return json.load(f)
+                cls._cache = json.load(f)
+            return cls._cache
         except Exception:
             return None
 
 
+# ============================================================================
+# WHISPER PROCESSOR
+# ============================================================================
+
+_PROCESSOR = None
+
+def get_processor():
+    """
+    Whisper processor shared by all scheduled runs
+    
+    WHY: Loading the model (weights + CUDA context) takes seconds per run
+    HOW: Created on first use and kept for the life of the scheduler process
+    """
+    global _PROCESSOR
+    if _PROCESSOR is None:
+        logger.info("Loading Whisper model...")
+        _PROCESSOR = create_whisper_processor()
+    return _PROCESSOR
+
+atexit.register(lambda: _PROCESSOR and _PROCESSOR.cleanup())
+
+_EMAIL = None
+
+def get_email_notifier():
+    """
+    Email notifier shared by all scheduled runs
+    
+    WHY: STARTTLS + login on every report costs several round trips
+    HOW: The authenticated SMTP connection is kept between reports and
+         re-established if the server has dropped it (NOOP check)
+    """
+    global _EMAIL
+    if _EMAIL is None:
+        _EMAIL = EmailNotifier()
+    return _EMAIL
+
+atexit.register(lambda: _EMAIL and _EMAIL.close())
+
+
 # ============================================================================
 # BATCH JOB EXECUTOR
 # ============================================================================
 
-def run_batch_job():
+@contextmanager
+def _batch_job():
+    """
+    Job lock, logging and completion state shared by both job runners
+    
+    Yields a dict for the run's 'stats', or None if the job lock could not
+    be taken (the caller returns without doing anything). Exceptions
+    in the body are logged and mark the job failed; they never reach the
+    scheduler.
+    """
+    logger.info("="*80)
+    logger.info("BATCH JOB STARTED")
+    logger.info("="*80)
+    
+    # Prevent overlapping runs (acquires the job lock)
+    try:
+        acquired = JobState.mark_running()
+    except Exception as e:
+        logger.error(f"Could not acquire job lock, skipping this run: {e}")
+        yield None
+        return
+    if not acquired:
+        logger.warning("Previous job still running, skipping this run")
+        yield None
+        return
+    
+    run = {'stats': None}
+    start_time = time.time()
+    try:
+        yield run
+        stats = run['stats']
+        
+        _log_job_complete(stats, time.time() - start_time)
+        
+        # Mark complete (a Whisper failure aborts the run with files left pending)
+        JobState.mark_complete(success=stats['whisper_error'] is None, stats=stats)
+        
+    except Exception as e:
+        logger.error(f"Batch job failed: {e}", exc_info=True)
+        JobState.mark_complete(success=False)
+    
+    finally:
+        logger.info("Batch job finished\n")
+
+
+def run_batch_job(reuse_processor: bool = True):
     """
     Execute batch processing job
     
     WORKFLOW:
     1. Check if job is already running (prevent overlap)
     2. Mark job as running
-    3. Initialize Azure Manager
+    3. Initialize Azure Processor (with the shared Whisper model)
     4. Process batch
     5. Mark job as complete
     6. Log results
@@ -200,54 +430,62 @@ def run_batch_job():
     - Logs errors
     - Always marks job as complete
     - Never crashes scheduler
-    """
-    logger.info("="*80)
-    logger.info("BATCH JOB STARTED")
-    logger.info("="*80)
-    
-    # Prevent overlapping runs
-    if JobState.is_running():
-        logger.warning("Previous job still running, skipping this run")
-        return
     
-    try:
-        # Mark as running
-        JobState.mark_running()
+    Args:
+        reuse_processor: Use the shared Whisper processor and email
+            notifier (False creates fresh ones for this run only)
+    """
+    with _batch_job() as run:
+        if run is None:
+            return
         
-        # Initialize manager
-        logger.info("Initializing Azure Manager...")
-        manager = AzureManager()
+        # Initialize processor
+        logger.info("Initializing Azure Processor...")
+        whisper = get_processor() if reuse_processor else None
+        email = get_email_notifier() if reuse_processor else None
+        processor = AzureProcessor(whisper_processor=whisper, email=email)
         
         # Process batch
         logger.info("Starting batch processing...")
-        start_time = time.time()
-        
-        manager.process_batch()
-        
-        elapsed = time.time() - start_time
-        
-        # Get statistics
-        stats = manager.get_processing_stats()
-        
-        logger.info("="*80)
-        logger.info("BATCH JOB COMPLETED")
-        logger.info("="*80)
-        logger.info(f"Processed: {stats['processed']}")
-        logger.info(f"Successful: {stats['successful']}")
-        logger.info(f"Failed: {stats['failed']}")
-        logger.info(f"Skipped (already processed): {stats['skipped']}")
-        logger.info(f"Total time: {elapsed:.1f}s")
-        logger.info("="*80)
+        run['stats'] = processor.process_all()
+
+
+async def run_batch_job_async():
+    """
+    Scheduled version of run_batch_job
+    
+    Same workflow, but blob I/O runs on the asyncio Azure SDK
+    (process_all_async) inside the scheduler's event loop; Whisper
+    runs in worker threads. Blocking setup (model load, the Azure account
+    check) is moved off the loop as well.
+    """
+    with _batch_job() as run:
+        if run is None:
+            return
         
-        # Mark complete
-        JobState.mark_complete(success=True, stats=stats)
+        # Initialize processor
+        logger.info("Initializing Azure Processor...")
+        whisper = await asyncio.to_thread(get_processor)
+        processor = await asyncio.to_thread(
+            AzureProcessor, whisper_processor=whisper, email=get_email_notifier()
+        )
         
-    except Exception as e:
-        logger.error(f"Batch job failed: {e}", exc_info=True)
-        JobState.mark_complete(success=False)
-    
-    finally:
-        logger.info("Batch job finished\n")
+        # Process batch
+        logger.info("Starting batch processing...")
+        run['stats'] = await processor.process_all_async()
+
+
+def _log_job_complete(stats: dict, elapsed: float):
+    """Log the summary of a finished batch job"""
+    logger.info("="*80)
+    logger.info("BATCH JOB COMPLETED")
+    logger.info("="*80)
+    logger.info(f"Processed: {stats['processed']}")
+    logger.info(f"Successful: {stats['successful']}")
+    logger.info(f"Failed: {stats['failed']}")
+    logger.info(f"Skipped (already processed): {stats['skipped']}")
+    logger.info(f"Total time: {elapsed:.1f}s")
+    logger.info("="*80)
 
 
 # ============================================================================
@@ -259,9 +497,11 @@ class BatchScheduler:
     Scheduled batch processing system
     
     FEATURES:
-    - Runs jobs at fixed intervals (default: 1 hour)
+    - Runs jobs at fixed intervals (default: 1 hour) on an asyncio event loop
+      (blob I/O is async; Whisper runs in worker threads)
+    - Missed runs are coalesced; late runs within the grace period still fire
     - Graceful shutdown handling
-    - Manual trigger support
+    - Manual trigger support (POST /trigger on the optional admin server)
     """
     
     def __init__(self, interval_minutes: int = BATCH_INTERVAL_MINUTES):
@@ -272,19 +512,105 @@ class BatchScheduler:
             interval_minutes: How often to run batch job (default: 60)
         """
         self.interval_minutes = interval_minutes
-        self.scheduler = BlockingScheduler()
+        JobState.set_interval(interval_minutes)
+        self._jobs = set()  # Batch job tasks in progress (awaited on shutdown)
+        self._stopping = False
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.scheduler = AsyncIOScheduler(
+            event_loop=self.loop,
+            job_defaults={
+                'max_instances': 1,  # Batch jobs never overlap
+                'coalesce': True,  # Collapse missed runs into one
+                'misfire_grace_time': MISFIRE_GRACE_SECONDS
+            }
+        )
         
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Setup signal handlers for graceful shutdown (run on the event loop)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            self.loop.add_signal_handler(signum, self._signal_handler, signum)
         
         logger.info(f"Scheduler initialized: {interval_minutes} minute interval")
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum):
         """Handle shutdown signals gracefully"""
         logger.info(f"Received signal {signum}, shutting down...")
+        if self._stopping:
+            return
+        self._stopping = True
+        self.loop.create_task(self._shutdown())
+    
+    async def _shutdown(self):
+        """Let a running batch job finish, stop the scheduler, then the loop"""
+        if self.scheduler.running:
+            self.scheduler.pause()  # No new runs while waiting
+        
+        if self._jobs:
+            logger.info("Waiting for the running batch job to finish...")
+            await asyncio.gather(*self._jobs, return_exceptions=True)
+        
         self.stop()
-        sys.exit(0)
+        while self.scheduler.running:  # shutdown() is queued on this loop
+            await asyncio.sleep(0)
+        self.loop.stop()
+    
+    async def _run_job(self):
+        """run_batch_job_async, tracked so shutdown can wait for it"""
+        task = asyncio.current_task()
+        self._jobs.add(task)
+        try:
+            await run_batch_job_async()
+        finally:
+            self._jobs.discard(task)
+    
+    async def _begin(self, run_immediately: bool):
+        """Optional first run, then start the interval schedule"""
+        if run_immediately:
+            logger.info("Running first batch immediately...")
+            await self._run_job()
+            if self._stopping:
+                return
+        
+        logger.info(f"Scheduler started. Next run in {self.interval_minutes} minutes")
+        logger.info("Press Ctrl+C to stop\n")
+        self.scheduler.start()
+    
+    async def _start_admin_server(self):
+        """Serve the admin endpoints on the scheduler's event loop"""
+        app = web.Application()
+        app.router.add_post('/trigger', self._handle_trigger)
+        app.router.add_get('/healthz', self._handle_health)
+        
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, ADMIN_HOST, ADMIN_PORT).start()
+        logger.info(f"Admin server listening on {ADMIN_HOST}:{ADMIN_PORT}")
+    
+    async def _handle_trigger(self, request):
+        """POST /trigger: run a batch job now (shared-secret header required)"""
+        token = request.headers.get(ADMIN_TOKEN_HEADER, '')
+        if not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+            return web.json_response({'error': 'unauthorized'}, status=401)
+        
+        if JobState.is_running():
+            return web.json_response({'status': 'already running'}, status=409)
+        
+        logger.info("Batch job triggered via admin endpoint")
+        self.scheduler.add_job(
+            self._run_job,
+            trigger='date',  # Run once, now
+            id='manual_batch_job',
+            name='Manual Batch Processing',
+            replace_existing=True
+        )
+        return web.json_response({'status': 'triggered'}, status=202)
+    
+    async def _handle_health(self, request):
+        """GET /healthz: scheduler liveness and last run state"""
+        return web.json_response({
+            'running': JobState.is_running(),
+            'last_run': JobState.get_last_run()
+        })
     
     def start(self, run_immediately: bool = True):
         """
@@ -302,9 +628,18 @@ class BatchScheduler:
         logger.info(f"Logs directory: {LOG_DIR.absolute()}")
         logger.info("="*80)
         
+        # Admin server first so /trigger and /healthz work during the first run
+        if ADMIN_PORT:
+            if web is None:
+                logger.warning("BATCH_ADMIN_PORT is set but aiohttp is not installed; admin server disabled")
+            elif not ADMIN_TOKEN:
+                logger.warning("BATCH_ADMIN_PORT is set without BATCH_ADMIN_TOKEN; admin server disabled")
+            else:
+                self.loop.run_until_complete(self._start_admin_server())
+        
         # Add job to scheduler
         self.scheduler.add_job(
-            run_batch_job,
+            self._run_job,
             trigger=IntervalTrigger(minutes=self.interval_minutes),
             id='batch_processing_job',
             name='Batch Processing',
@@ -312,25 +647,18 @@ class BatchScheduler:
             replace_existing=True
         )
         
-        # Run immediately if requested
-        if run_immediately:
-            logger.info("Running first batch immediately...")
-            run_batch_job()
-        
-        # Start scheduler
-        logger.info(f"Scheduler started. Next run in {self.interval_minutes} minutes")
-        logger.info("Press Ctrl+C to stop\n")
-        
-        try:
-            self.scheduler.start()
-        except (KeyboardInterrupt, SystemExit):
-            self.stop()
+        # First run (if requested) and the schedule run on the loop; a
+        # signal stops it once the current batch has finished
+        self.loop.create_task(self._begin(run_immediately))
+        self.loop.run_forever()
+        logger.info("Scheduler stopped")
     
     def stop(self):
-        """Stop the scheduler"""
+        """Stop the scheduler (running batch jobs are awaited by _shutdown)"""
+        if not self.scheduler.running:
+            return
         logger.info("Stopping scheduler...")
-        self.scheduler.shutdown(wait=True)
-        logger.info("Scheduler stopped")
+        self.scheduler.shutdown(wait=False)
 
 
 # ============================================================================
@@ -399,7 +727,7 @@ def main():
         
         elif args.command == 'run-once':
             logger.info("Running batch job once...")
-            run_batch_job()
+            run_batch_job(reuse_processor=False)
         
         elif args.command == 'status':
             last_run = JobState.get_last_run()
@@ -409,7 +737,7 @@ def main():
             print("="*80)
             
             if last_run:
-                print(f"Running: {last_run.get('running', False)}")
+                print(f"Running: {JobState.is_running()}")
                 
                 if 'last_run_time' in last_run:
                     print(f"Last run: {last_run['last_run_time']}")
@@ -1,52 +1,173 @@
+import io
 import os
 import json
 import time
+import queue
+import atexit
 import logging
 import hashlib
+import itertools
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union, BinaryIO
 from dataclasses import dataclass, asdict
-from faster_whisper import WhisperModel
+import threading
+
+# CTranslate2 CUDA option: FP16 GEMM with reduced-precision reductions (read when the
+# library loads; an existing env value wins). CT2_USE_EXPERIMENTAL_PACKED_GEMM (MKL,
+# CPU only) is left to the environment.
+os.environ.setdefault('CT2_CUDA_ALLOW_FP16_REDUCED_PRECISION_REDUCTION', '1')
+
+import numpy as np
+import ctranslate2
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from faster_whisper.audio import decode_audio
+from _textops import deduplicate_text
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 MODEL_DIR = os.environ.get('WHISPER_MODEL_DIR', '/opt/whisper_models')
+DEVICE = os.environ.get('WHISPER_DEVICE', 'cuda')
 MODEL_CONFIG = {
     "name": os.environ.get('WHISPER_MODEL', 'Systran/faster-whisper-large-v3'),
-    "device": os.environ.get('WHISPER_DEVICE', 'cuda'),
-    "compute_type": os.environ.get('WHISPER_COMPUTE_TYPE', 'float32'),
+    "device": DEVICE,
+    # INT8 weights are quantized at load time (post-training, deterministic per checkpoint)
+    "compute_type": os.environ.get('WHISPER_COMPUTE_TYPE', 'int8_float16' if DEVICE == 'cuda' else 'int8'),
     "download_root": MODEL_DIR,
     "local_files_only": True,  # since models are pre-downloaded
+    # CUDA devices: comma list ("0,1") or "all"; one model replica per device
+    "device_index": os.environ.get('WHISPER_DEVICE_INDEX', '0'),
 }
 
-BEAM_SIZE = int(os.environ.get('WHISPER_BEAM_SIZE', '5'))
+# Throughput mode: greedy decoding, no fallback sampling, chunks decoded independently
+THROUGHPUT_MODE = os.environ.get('WHISPER_THROUGHPUT_MODE') == '1'
+BEAM_SIZE = int(os.environ.get('WHISPER_BEAM_SIZE', '1' if THROUGHPUT_MODE else '5'))
+DECODE_OPTIONS = {
+    "best_of": 1,
+    "temperature": 0.0,
+    "condition_on_previous_text": False,
+} if THROUGHPUT_MODE else {}
+BATCH_SIZE = int(os.environ.get('WHISPER_BATCH_SIZE', '16'))  # VAD chunks decoded together (1 = sequential)
+SAMPLING_RATE = 16000  # Whisper input rate
+DECODE_WORKERS = 2  # Files decoded ahead of the GPU in process_audio_batch
+WARMUP = os.environ.get('WHISPER_WARMUP', '1') == '1'  # Dummy pass at init so the first file runs at full speed
+# Opt-in: keep GPU-feeding threads on the GPUs' NUMA nodes and decode threads off them
+PIN_CPUS = os.environ.get('WHISPER_PIN_CPUS') == '1'
+PCI_DEVICES_DIR = Path('/sys/bus/pci/devices')
+ENGLISH_TRANSCRIBE_CONFIDENCE = 0.9  # Above this, English audio is transcribed instead of translated
 VAD_FILTER = True
 VAD_PARAMS = {"min_silence_duration_ms": 500}
+# Tried in order after the configured compute type if the device rejects it
+COMPUTE_TYPE_FALLBACKS = {
+    'cuda': ['int8_float16', 'float16', 'float32'],
+    'cpu': ['int8', 'float32'],
+}
 SUPPORTED_LANGUAGES = {"en": "English", "hi": "Hindi", "ta": "Tamil", "te": "Telugu",}
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-8s | %(message)s'
-)
+def _setup_logging():
+    """
+    Console logging through a queue (like logging.basicConfig, but the
+    formatting and stderr writes run on a background listener thread)
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s | %(levelname)-8s | %(message)s'))
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+_setup_logging()
 logger = logging.getLogger(__name__)
 
-def deduplicate_text(text: str) -> str:
-    """
-    Remove duplicate consecutive sentences or phrases.
-    Simple deduplication by removing consecutive duplicate sentences.
+def _parse_cpulist(cpulist: str) -> Set[int]:
+    """Parse a sysfs CPU list such as '0-15,32-47'"""
+    cpus = set()
+    for part in cpulist.strip().split(','):
+        if part:
+            first, _, last = part.partition('-')
+            cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+def cuda_pci_bus_id(device: int) -> str:
     """
-    if not text:
-        return text
+    sysfs PCI address (e.g. '0000:3b:00.0') of a CUDA device, via nvidia-smi
     
-    sentences = [s.strip() for s in text.split('.') if s.strip()]
-    if not sentences:
-        return text
+    Honours CUDA_VISIBLE_DEVICES. nvidia-smi numbers GPUs in PCI order, which
+    matches CUDA's numbering with CUDA_DEVICE_ORDER=PCI_BUS_ID or identical GPUs.
+    """
+    visible = os.environ.get('CUDA_VISIBLE_DEVICES')
+    if visible:
+        device = visible.split(',')[device].strip()  # Index or UUID; nvidia-smi -i takes both
+    bus_id = subprocess.run(
+        ['nvidia-smi', '--query-gpu=pci.bus_id', '--format=csv,noheader', '-i', str(device)],
+        capture_output=True, text=True, check=True, timeout=10
+    ).stdout.strip()
+    return bus_id[-12:].lower()  # '00000000:3B:00.0' -> '0000:3b:00.0'
+
+def gpu_cpu_partition(device_index: List[int]) -> Tuple[Set[int], Set[int]]:
+    """
+    Split the CPUs this process may use into (NUMA nodes of the CUDA
+    devices, the rest)
     
-    deduplicated = [sentences[0]]
-    for sentence in sentences[1:]:
-        if sentence != deduplicated[-1]:
-            deduplicated.append(sentence)
+    WHISPER_GPU_NUMA_NODE overrides the node read from sysfs. Returns two
+    empty sets when a node is unknown.
+    """
+    node = os.environ.get('WHISPER_GPU_NUMA_NODE')
+    try:
+        if node is not None:
+            nodes = {int(node)}
+        else:
+            nodes = {
+                int((PCI_DEVICES_DIR / cuda_pci_bus_id(device) / 'numa_node').read_text())
+                for device in device_index
+            }
+        if min(nodes) < 0:  # -1: no NUMA information
+            return set(), set()
+        node_cpus = set()
+        for node in nodes:
+            node_cpus |= _parse_cpulist(Path(f'/sys/devices/system/node/node{node}/cpulist').read_text())
+    except (OSError, ValueError, IndexError, subprocess.SubprocessError):
+        return set(), set()
     
-    return '. '.join(deduplicated) + ('.' if text.rstrip().endswith('.') else '')
+    allowed = os.sched_getaffinity(0)
+    local = node_cpus & allowed
+    return local, allowed - local
+
+def parse_device_index(spec: Union[int, str, List[int]]) -> List[int]:
+    """Device index setting -> list of CUDA device indices"""
+    if isinstance(spec, int):
+        return [spec]
+    if isinstance(spec, list):
+        return spec
+    if spec.strip() == 'all':
+        return list(range(ctranslate2.get_cuda_device_count())) or [0]
+    return [int(i) for i in spec.split(',') if i.strip()]
+
+def make_file_id(key: str) -> str:
+    """16-hex-char ID for a result (xxh3-64, or blake2b-64 without xxhash)"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(key.encode(), seed=0)
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
 
 @dataclass
 class TranslationResult:
@@ -69,6 +190,9 @@ class TranslationResult:
         return asdict(self)
     
     def to_json(self) -> str:
+        if orjson is not None:
+            # orjson serializes dataclasses directly, no intermediate dict
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
 
 class WhisperProcessor:
@@ -77,49 +201,258 @@ class WhisperProcessor:
     Audio → English translation only
     """
     
-    def __init__(self):
+    def __init__(self, device_index: Union[int, str, List[int], None] = None):
+        """
+        Args:
+            device_index: CUDA device(s) to load the model on (default:
+                MODEL_CONFIG['device_index']). With several devices, files
+                are translated concurrently, one per device.
+        """
+        if MODEL_CONFIG['device'] == 'cuda':
+            self.device_index = parse_device_index(
+                MODEL_CONFIG['device_index'] if device_index is None else device_index
+            )
+        else:
+            self.device_index = [0]
+        self.workers = len(self.device_index)  # Files that can be in Whisper at once
+        
         logger.info("="*70)
         logger.info("WHISPER PROCESSOR - DIRECT TRANSLATION")
         logger.info("="*70)
         logger.info(f"Model: {MODEL_CONFIG['name']}")
-        logger.info(f"Device: {MODEL_CONFIG['device']}")
-        logger.info(f"Compute: {MODEL_CONFIG['compute_type']}")
+        logger.info(f"Device: {MODEL_CONFIG['device']} {self.device_index}")
+        logger.info(f"Batch size: {BATCH_SIZE}")
+        logger.info(f"Beam size: {BEAM_SIZE}{' (throughput mode)' if THROUGHPUT_MODE else ''}")
+        
+        # CPU sets for pin_whisper_thread()/pin_decode_thread() (None: not pinned)
+        self._gpu_cpus: Optional[Set[int]] = None
+        self._decode_cpus: Optional[Set[int]] = None
+        if PIN_CPUS and MODEL_CONFIG['device'] == 'cuda':
+            self._partition_cpus()
         
         try:
             load_start = time.time()
-            self.model = WhisperModel(
-                MODEL_CONFIG['name'],
-                device=MODEL_CONFIG['device'],
-                compute_type=MODEL_CONFIG['compute_type'],
-                download_root=MODEL_CONFIG['download_root'],
-                local_files_only=MODEL_CONFIG['local_files_only']
-            )
+            # CTranslate2 starts its per-device threads here; they inherit the GPU-local CPUs
+            caller_cpus = os.sched_getaffinity(0)
+            self.pin_whisper_thread()
+            try:
+                self.model = self._load_model()
+            finally:
+                os.sched_setaffinity(0, caller_cpus)
+            # Batched pipeline: VAD chunks of a file are decoded as one padded batch
+            self.pipeline = BatchedInferencePipeline(model=self.model) if BATCH_SIZE > 1 else None
             load_time = time.time() - load_start
             logger.info(f"✓ Model loaded in {load_time:.2f}s")
+            
+            if WARMUP:
+                self._warmup()
             logger.info("✓ Ready")
             logger.info("="*70 + "\n")
         except Exception as e:
             logger.error(f"Initialization failed: {e}")
             raise
     
+    def _partition_cpus(self):
+        """GPU-feeding threads get the GPUs' NUMA nodes; decode threads get the rest"""
+        gpu_cpus, other_cpus = gpu_cpu_partition(self.device_index)
+        if not gpu_cpus:
+            logger.warning("CPU pinning skipped: GPU NUMA node unknown")
+            return
+        
+        self._gpu_cpus = gpu_cpus
+        self._decode_cpus = other_cpus or None
+        logger.info(f"Whisper on {len(gpu_cpus)} GPU-local CPUs; decode on {len(other_cpus) or 'the same'} CPUs")
+    
+    def pin_whisper_thread(self):
+        """Pin the calling thread (one that runs process_audio) to the GPU-local CPUs"""
+        if self._gpu_cpus:
+            os.sched_setaffinity(0, self._gpu_cpus)
+    
+    def pin_decode_thread(self):
+        """Pin the calling thread (one that runs decode_audio) off the GPU-local CPUs"""
+        if self._decode_cpus:
+            os.sched_setaffinity(0, self._decode_cpus)
+    
+    def _load_model(self) -> WhisperModel:
+        """
+        Load the model with the configured compute type, falling back
+        through COMPUTE_TYPE_FALLBACKS if the device does not support it
+        """
+        configured = MODEL_CONFIG['compute_type']
+        fallbacks = COMPUTE_TYPE_FALLBACKS.get(MODEL_CONFIG['device'], [])
+        candidates = [configured] + [ct for ct in fallbacks if ct != configured]
+        
+        for i, compute_type in enumerate(candidates):
+            try:
+                model = WhisperModel(
+                    MODEL_CONFIG['name'],
+                    device=MODEL_CONFIG['device'],
+                    device_index=self.device_index,  # One replica (worker) per device
+                    num_workers=1,  # Replicas per device; more would share a GPU
+                    compute_type=compute_type,
+                    download_root=MODEL_CONFIG['download_root'],
+                    local_files_only=MODEL_CONFIG['local_files_only']
+                )
+            except ValueError as e:
+                if i == len(candidates) - 1:
+                    raise
+                logger.warning(f"Compute type {compute_type} not supported: {e}")
+                continue
+            
+            MODEL_CONFIG['compute_type'] = compute_type
+            logger.info(f"Compute: {compute_type}")
+            return model
+    
+    def _warmup(self):
+        """
+        Run one second of silence through the model so kernel selection and
+        workspace allocation happen now rather than on the first real file
+        (one concurrent pass per device)
+        """
+        warmup_start = time.time()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(lambda _: self._warmup_pass(), range(self.workers)))
+        logger.info(f"✓ Warmed up in {time.time() - warmup_start:.2f}s")
+    
+    def _warmup_pass(self):
+        segments, _ = self.model.transcribe(
+            np.zeros(SAMPLING_RATE, dtype=np.float32),
+            task='translate',
+            beam_size=1,
+            vad_filter=False  # VAD would drop the silence and skip decoding
+        )
+        for _ in segments:
+            pass
+    
     def process_audio_file(self, audio_path: str) -> Dict:
+        """
+        Process audio file → English translation
+        
+        Returns:
+            Dictionary with translation result
+        """
+        return self.process_audio(audio_path, os.path.basename(audio_path))
+    
+    def process_audio_batch(self, audio_paths: List[str]) -> List[Dict]:
+        """
+        Process several audio files through the same model/pipeline
+        
+        Audio decoding runs on a small CPU thread pool, at most DECODE_WORKERS
+        files ahead, so the next file is decoded while the GPU translates the
+        current one. With several devices, files are dispatched to one
+        translation thread per device.
+        
+        Returns:
+            List of translation results, in input order
+        """
+        results = []
+        paths = iter(audio_paths)
+        slots = threading.Semaphore(self.workers)  # Caps decoded files waiting for a device
+        
+        with ThreadPoolExecutor(
+            max_workers=DECODE_WORKERS,
+            thread_name_prefix='decode',
+            initializer=self.pin_decode_thread
+        ) as pool, ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix='whisper',
+            initializer=self.pin_whisper_thread
+        ) as whisper_pool:
+            window = deque(
+                (path, pool.submit(self.decode_audio, path))
+                for path in itertools.islice(paths, DECODE_WORKERS)
+            )
+            while window:
+                path, future = window.popleft()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    window.append((next_path, pool.submit(self.decode_audio, next_path)))
+                
+                try:
+                    audio = future.result()
+                except Exception:
+                    audio = path  # Let process_audio decode it and report the error
+                
+                slots.acquire()
+                result = whisper_pool.submit(self.process_audio, audio, os.path.basename(path))
+                result.add_done_callback(lambda _: slots.release())
+                results.append(result)
+        
+        return [result.result() for result in results]
+    
+    def decode_audio(self, audio: Union[str, BinaryIO]) -> np.ndarray:
+        """Decode audio to mono float32 samples at 16 kHz (CPU only, thread-safe)"""
+        if isinstance(audio, str):
+            # Start readahead of the whole file so disk reads overlap decoding
+            # (PyAV still opens it by path; errors are left to the decoder)
+            try:
+                fd = os.open(audio, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+        
+        return decode_audio(audio, sampling_rate=SAMPLING_RATE)
+    
+    def _detect_language(self, samples: np.ndarray) -> Tuple[str, float]:
+        """
+        Encoder-only language detection on the first 30s of speech
+        (same VAD filter as transcribe, so silence/hold music is ignored)
+        """
+        lang_code, confidence, _ = self.model.detect_language(
+            samples,
+            vad_filter=VAD_FILTER,
+            vad_parameters=VAD_PARAMS
+        )
+        return lang_code, confidence
+    
+    def _transcribe(self, audio: Union[str, BinaryIO, np.ndarray], language: str, task: str):
+        """Run Whisper with the batched pipeline when enabled, else sequentially"""
+        if self.pipeline is not None:
+            # The pipeline object keeps per-call state; give concurrent calls their own
+            pipeline = self.pipeline if self.workers == 1 else BatchedInferencePipeline(model=self.model)
+            return pipeline.transcribe(
+                audio,
+                language=language,
+                task=task,
+                batch_size=BATCH_SIZE,
+                beam_size=BEAM_SIZE,
+                vad_filter=VAD_FILTER,
+                vad_parameters=VAD_PARAMS,
+                **DECODE_OPTIONS
+            )
+        
+        return self.model.transcribe(
+            audio,
+            language=language,  # Already detected, skips re-detection
+            task=task,
+            beam_size=BEAM_SIZE,
+            vad_filter=VAD_FILTER,
+            vad_parameters=VAD_PARAMS,
+            **DECODE_OPTIONS
+        )
+    
+    def process_audio(self, audio: Union[str, BinaryIO, np.ndarray], filename: str) -> Dict:
         """
         Process audio → English translation
         
+        Args:
+            audio: File path, binary file-like object (e.g. BytesIO from a blob
+                download) or samples already decoded by decode_audio()
+            filename: Name recorded in the result
+        
         Returns:
             Dictionary with translation result
         """
         start_time = time.time()
-        filename = Path(audio_path).name
-        file_id = hashlib.md5(
-            f"{filename}_{datetime.now().isoformat()}".encode()
-        ).hexdigest()[:16]
         
         logger.info(f"Processing: {filename}")
         
         # Initialize result
         result = TranslationResult(
-            id=file_id,
+            id="",
             filename=filename,
             audio_duration=0.0,
             detected_language="unknown",
@@ -128,42 +461,47 @@ class WhisperProcessor:
             translation="",
             translation_time=0.0,
             model_name=MODEL_CONFIG['name'],
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.fromtimestamp(start_time).isoformat(),
             status='failed'
         )
         
         try:
-            # OPTIMIZED: Single transcribe call for both language detection AND translation
-            logger.info("  [1/1] Detecting language + translating to English...")
-            translate_start = time.time()
+            result.id = make_file_id(f"{filename}_{time.time_ns()}")
             
-            segments, info = self.model.transcribe(
-                audio_path,
-                task='translate',  # Will auto-detect language and translate
-                beam_size=BEAM_SIZE,
-                vad_filter=VAD_FILTER,
-                vad_parameters=VAD_PARAMS
-            )
+            logger.info("  [1/2] Detecting language...")
+            translate_start = time.time()
             
-            # Extract language info from the SAME transcription call
-            lang_code = info.language
-            confidence = info.language_probability
+            if not isinstance(audio, np.ndarray):
+                audio = self.decode_audio(audio)
+            lang_code, confidence = self._detect_language(audio)
             lang_name = SUPPORTED_LANGUAGES.get(lang_code, lang_code.upper())
             
             logger.info(f"  → Detected: {lang_name} ({lang_code}) - {confidence:.1%}")
             
+            # Confident English (detected on speech) needs no translation; transcribing is cheaper
+            if VAD_FILTER and lang_code == 'en' and confidence > ENGLISH_TRANSCRIBE_CONFIDENCE:
+                task = 'transcribe'
+                logger.info("  [2/2] Transcribing (already English)...")
+            else:
+                task = 'translate'
+                logger.info("  [2/2] Translating to English...")
+            
+            segments, info = self._transcribe(audio, language=lang_code, task=task)
+            
             result.language_code = lang_code
             result.detected_language = lang_name
             result.language_confidence = confidence
             result.audio_duration = info.duration
             
-            # Collect translation segments
-            translation_parts = []
+            # Collect translation segments as they are decoded
+            buf = io.StringIO()
             for segment in segments:
-                if segment.text.strip():
-                    translation_parts.append(segment.text.strip())
+                text = segment.text.strip()
+                if text:
+                    buf.write(text)
+                    buf.write(' ')
             
-            raw_translation = ' '.join(translation_parts)
+            raw_translation = buf.getvalue().rstrip()
             
             # Deduplicate
             translation = deduplicate_text(raw_translation)
@@ -198,32 +536,34 @@ def main():
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python whisper_processor.py <audio_file>")
+        print("Usage: python whisper_processor.py <audio_file> [<audio_file> ...]")
         sys.exit(1)
     
-    audio_file = sys.argv[1]
-    if not Path(audio_file).exists():
-        print(f"Error: File not found: {audio_file}")
-        sys.exit(1)
+    audio_files = sys.argv[1:]
+    for audio_file in audio_files:
+        if not os.path.isfile(audio_file):
+            print(f"Error: File not found: {audio_file}")
+            sys.exit(1)
     
     print("="*70)
     print("WHISPER PROCESSOR TEST")
     print("="*70)
-    print(f"File: {audio_file}\n")
+    print(f"Files: {', '.join(audio_files)}\n")
     
     try:
         processor = WhisperProcessor()
-        result = processor.process_audio_file(audio_file)
-        
-        print("\n" + "="*70)
-        print("RESULT")
-        print("="*70)
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        results = processor.process_audio_batch(audio_files)
         
-        if result['status'] == 'success':
-            print("\n✓ Success!")
-        else:
-            print(f"\n✗ Failed: {result.get('error')}")
+        for result in results:
+            print("\n" + "="*70)
+            print(f"RESULT: {result['filename']}")
+            print("="*70)
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+            
+            if result['status'] == 'success':
+                print("\n✓ Success!")
+            else:
+                print(f"\n✗ Failed: {result.get('error')}")
     
     except Exception as e:
         print(f"\nError: {e}")